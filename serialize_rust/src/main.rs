@@ -123,6 +123,34 @@ fn generate_dataset_int_tree(depth: usize, children_per_node: usize) -> Serializ
     }
 }
 
+// Many small key-value records of ~100 B to ~4 KB (serialized as JSON) each
+fn generate_dataset_small_records(count: usize) -> SerializableData {
+    const KEY_LENGTH: usize = 8;
+    const STRING_LENGTH: usize = 16;
+
+    random_list(count, || {
+        let fields = rand::thread_rng().gen_range(4..=150);
+        random_list(fields, || {
+            let pair = random_kvpair(KEY_LENGTH - 1, || random_choice(vec![
+                random_int,
+                random_bigint,
+                random_float,
+                random_bigfloat,
+                random_boolean,
+                || random_string(STRING_LENGTH)
+            ]));
+            // Keys must start with a letter to be valid XML tag names
+            match pair {
+                SerializableData::KeyValuePair(key, value) => {
+                    let prefix = rand::thread_rng().gen_range(b'a'..=b'z') as char;
+                    SerializableData::KeyValuePair(format!("{}{}", prefix, key), value)
+                }
+                other => other,
+            }
+        })
+    })
+}
+
 fn generate_datasets() {
     let dataset = generate_dataset_flat_intlist((2 as usize).pow(28));
     let serialized = JSONSerializer::serialize(&dataset).unwrap();
@@ -202,6 +230,21 @@ fn generate_datasets() {
     drop(dataset);
     drop(serialized);
 
+    // ~2.4M nodes
+    let dataset = generate_dataset_int_tree(7, 8);
+    let serialized = JSONSerializer::serialize(&dataset).unwrap();
+    std::fs::write(format!("{}/dataset_int_tree_medium.json", DATASET_DIR), &serialized).unwrap();
+    drop(dataset);
+    drop(serialized);
+
+    // ~2.1M nodes, shallow and wide
+    let dataset = generate_dataset_int_tree(3, 128);
+    let serialized = JSONSerializer::serialize(&dataset).unwrap();
+    std::fs::write(format!("{}/dataset_int_tree_wide.json", DATASET_DIR), &serialized).unwrap();
+    drop(dataset);
+    drop(serialized);
+
+    // ~19M nodes
     let dataset = generate_dataset_int_tree(8, 8);
     let serialized = JSONSerializer::serialize(&dataset).unwrap();
     std::fs::write(format!("{}/dataset_int_tree_large.json", DATASET_DIR), &serialized).unwrap();
@@ -213,6 +256,12 @@ fn generate_datasets() {
     std::fs::write(format!("{}/dataset_mixed_list_256MB.json", DATASET_DIR), &serialized).unwrap();
     drop(dataset);
     drop(serialized);
+
+    let dataset = generate_dataset_small_records(100_000);
+    let serialized = JSONSerializer::serialize(&dataset).unwrap();
+    std::fs::write(format!("{}/dataset_small_records_100k.json", DATASET_DIR), &serialized).unwrap();
+    drop(dataset);
+    drop(serialized);
 }
 
 fn fetch_sysinfo() -> SysInfo {
@@ -0,0 +1,188 @@
+"""Cold-start benchmark.
+
+Launches fresh interpreters per codec and measures what a short-lived worker
+pays before it reaches steady state: module import time (via -X importtime),
+ProtoBuf descriptor-pool construction and the latency of the first versus the
+Nth serialize/deserialize call. It also compares the startup of evaluator.py
+with lazy and with eager codec imports.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from cold_start_worker import CODEC_MODULES
+from evaluator import (
+    DATASETS_DIR,
+    OUTPUT_DIR,
+    append_to_file,
+    get_protocols,
+    get_system_info,
+)
+
+COLD_START_OUTPUT_FILE = os.path.join(OUTPUT_DIR, "cold_start_results.json")
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKER_SCRIPT = os.path.join(SCRIPT_DIR, "cold_start_worker.py")
+SLOWEST_IMPORTS = 5
+STEADY_STATE_FRACTION = 0.1  # Last 10% of the calls count as steady state
+
+
+def child_env(lazy_imports=True):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (SCRIPT_DIR, env.get("PYTHONPATH")) if path
+    )
+    env["EVALUATOR_LAZY_IMPORTS"] = "1" if lazy_imports else "0"
+    return env
+
+
+def parse_importtime(stderr):
+    """Return (module, level, self seconds, cumulative seconds) per -X importtime line."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name_field = line[len("import time:") :].split("|")
+        indent = len(name_field) - len(name_field.lstrip()) - 1
+        entries.append(
+            (
+                name_field.strip(),
+                indent // 2,
+                int(self_us) / 1e6,
+                int(cumulative_us) / 1e6,
+            )
+        )
+    return entries
+
+
+def run_importtime(code, env):
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(process.stderr)
+
+
+def measure_imports(code, startup_modules, env):
+    """Import time of `code` without the interpreter's own startup imports."""
+    entries = [e for e in run_importtime(code, env) if e[0] not in startup_modules]
+    total = sum(cumulative for _, level, _, cumulative in entries if level == 0)
+    slowest = sorted(entries, key=lambda e: e[2], reverse=True)[:SLOWEST_IMPORTS]
+    return total, [[name, self_time] for name, _, self_time, _ in slowest]
+
+
+def measure_wall_time(code, env):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+    return time.perf_counter() - start
+
+
+def run_worker(protocol_name, dataset_path, calls):
+    process = subprocess.run(
+        [sys.executable, WORKER_SCRIPT, protocol_name, dataset_path, str(calls)],
+        env=child_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+def summarize_calls(runs, key):
+    # Median over the fresh interpreters for every call index
+    per_call = [statistics.median(times) for times in zip(*(run[key] for run in runs))]
+    steady = per_call[-max(1, int(len(per_call) * STEADY_STATE_FRACTION)) :]
+    second = per_call[1] if len(per_call) > 1 else None
+    return per_call[0], second, statistics.median(steady)
+
+
+def run_cold_start_tests(
+    dataset_file="dataset_int_tree_small.json", calls=100, repeats=5, protocol_names=None
+):
+    """Measure import, descriptor setup and first-call latency in fresh interpreters."""
+    with open(COLD_START_OUTPUT_FILE, "w") as f:
+        f.write(json.dumps({"system_info": get_system_info()}, indent=2) + "\n")
+
+    dataset_path = os.path.abspath(os.path.join(DATASETS_DIR, dataset_file))
+    startup_modules = {name for name, *_ in run_importtime("pass", child_env())}
+
+    for protocol_name, _, _ in get_protocols(dataset_file):
+        if protocol_names and protocol_name not in protocol_names:
+            continue
+        print(f"[{dataset_file}][{protocol_name}] {repeats} fresh interpreters")
+
+        import_code = "import " + ", ".join(CODEC_MODULES[protocol_name])
+        if protocol_name.startswith("ProtoBuf"):
+            import_code += ", datasets_pb2"
+        import_measurements = [
+            measure_imports(import_code, startup_modules, child_env())
+            for _ in range(repeats)
+        ]
+        runs = [run_worker(protocol_name, dataset_path, calls) for _ in range(repeats)]
+
+        first_serialization, second_serialization, steady_serialization = (
+            summarize_calls(runs, "serialization_times")
+        )
+        first_deserialization, second_deserialization, steady_deserialization = (
+            summarize_calls(runs, "deserialization_times")
+        )
+        descriptor_times = [run["descriptor_time"] for run in runs]
+
+        result = {
+            "Dataset": dataset_file,
+            "Protocol": protocol_name,
+            "Calls": calls,
+            "Import Time (s)": statistics.median(m[0] for m in import_measurements),
+            "Slowest Imports (s)": import_measurements[0][1],
+            "In-Process Import Time (s)": statistics.median(
+                run["import_time"] for run in runs
+            ),
+            "Evaluator Import Time (s)": statistics.median(
+                run["evaluator_import_time"] for run in runs
+            ),
+            "Descriptor Setup Time (s)": (
+                statistics.median(descriptor_times)
+                if protocol_name.startswith("ProtoBuf")
+                else None
+            ),
+            "First Serialization Time (s)": first_serialization,
+            "Second Serialization Time (s)": second_serialization,
+            "Steady Serialization Time (s)": steady_serialization,
+            "First Deserialization Time (s)": first_deserialization,
+            "Second Deserialization Time (s)": second_deserialization,
+            "Steady Deserialization Time (s)": steady_deserialization,
+        }
+        append_to_file(COLD_START_OUTPUT_FILE, result)
+        print(
+            f"{protocol_name}: import {result['Import Time (s)'] * 1e3:.1f} ms, "
+            f"first/steady serialize {first_serialization * 1e3:.2f}/"
+            f"{steady_serialization * 1e3:.2f} ms"
+        )
+
+    # Does importing the codecs lazily cut the startup of evaluator.py?
+    print("Comparing lazy and eager imports of evaluator.py")
+    result = {"Protocol": "evaluator.py"}
+    for label, lazy_imports in (("Lazy", True), ("Eager", False)):
+        env = child_env(lazy_imports)
+        import_measurements = [
+            measure_imports("import evaluator", startup_modules, env)
+            for _ in range(repeats)
+        ]
+        wall_times = [measure_wall_time("import evaluator", env) for _ in range(repeats)]
+        result[f"{label} Import Time (s)"] = statistics.median(
+            m[0] for m in import_measurements
+        )
+        result[f"{label} Startup Wall Time (s)"] = statistics.median(wall_times)
+    append_to_file(COLD_START_OUTPUT_FILE, result)
+    print(
+        f"evaluator.py startup: lazy {result['Lazy Startup Wall Time (s)'] * 1e3:.1f} ms, "
+        f"eager {result['Eager Startup Wall Time (s)'] * 1e3:.1f} ms"
+    )
+
+    print(f"All results saved to {COLD_START_OUTPUT_FILE}")
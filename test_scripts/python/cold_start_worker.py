@@ -0,0 +1,90 @@
+"""Fresh-interpreter child of the cold-start benchmark.
+
+Usage: cold_start_worker.py <protocol> <dataset path> <calls>
+
+Imports the codec's modules, builds the ProtoBuf descriptors and times the
+first <calls> serialize/deserialize calls, then prints the measurements as one
+JSON line. Only importlib, os, sys and time are imported up front and before
+any timer starts (os, sys and time are loaded by interpreter startup anyway),
+so every timed import starts cold.
+"""
+
+import importlib
+import os
+import sys
+import time
+
+PROTOBUF_MODULES = [
+    "google.protobuf.descriptor",
+    "google.protobuf.descriptor_pool",
+    "google.protobuf.runtime_version",
+    "google.protobuf.symbol_database",
+    "google.protobuf.internal.builder",
+]
+ARROW_MODULES = ["numpy", "pyarrow"]
+
+# Modules each codec needs before its first call, datasets_pb2 is timed separately
+CODEC_MODULES = {
+    "JSON": ["json"],
+    "XML": ["lxml.etree"],
+    "MessagePack": ["msgpack"],
+    "ProtoBuf": PROTOBUF_MODULES,
+    "ProtoBuf (flat)": PROTOBUF_MODULES,
+    "Arrow IPC (stream)": ARROW_MODULES,
+    "Arrow IPC (file)": ARROW_MODULES,
+    "NumPy (.npy)": ["numpy"],
+}
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(protocol_name, dataset_path, calls):
+    start = time.perf_counter()
+    for module in CODEC_MODULES[protocol_name]:
+        importlib.import_module(module)
+    import_time = time.perf_counter() - start
+
+    # AddSerializedFile and BuildMessageAndEnumDescriptors run at import
+    descriptor_time = None
+    if protocol_name.startswith("ProtoBuf"):
+        _, descriptor_time = timed(importlib.import_module, "datasets_pb2")
+
+    evaluator, evaluator_import_time = timed(importlib.import_module, "evaluator")
+    dataset = evaluator.load_json_dataset(dataset_path)
+    serialize_func, deserialize_func = next(
+        (serialize_func, deserialize_func)
+        for name, serialize_func, deserialize_func in evaluator.get_protocols(
+            os.path.basename(dataset_path)
+        )
+        if name == protocol_name
+    )
+
+    serialization_times = []
+    deserialization_times = []
+    for _ in range(calls):
+        serialized_data, serialization_time = timed(serialize_func, dataset)
+        _, deserialization_time = timed(deserialize_func, serialized_data)
+        serialization_times.append(serialization_time)
+        deserialization_times.append(deserialization_time)
+
+    import json
+
+    print(
+        json.dumps(
+            {
+                "import_time": import_time,
+                "descriptor_time": descriptor_time,
+                "evaluator_import_time": evaluator_import_time,
+                "serialization_times": serialization_times,
+                "deserialization_times": deserialization_times,
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1], sys.argv[2], int(sys.argv[3]))
@@ -0,0 +1,169 @@
+"""Performance regression detection between two benchmark result sets.
+
+Cells are matched by dataset and protocol. For every timing metric the raw
+per-repeat samples of both runs are compared with a two-sided Mann-Whitney U
+test, and a cell is flagged when the median moved by more than the threshold
+and the difference is significant.
+"""
+
+import math
+import statistics
+
+from results_io import load_results
+
+METRICS = [
+    ("Serialization", "Serialization Times (s)"),
+    ("Deserialization", "Deserialization Times (s)"),
+]
+
+REGRESSION = "REGRESSION"
+IMPROVEMENT = "improvement"
+UNCHANGED = "unchanged"
+UNTESTED = "no samples"
+MISSING = "MISSING"
+
+
+def mann_whitney_u(a, b):
+    """Two-sided p-value of the Mann-Whitney U test (normal approximation, tie corrected)."""
+    n1, n2 = len(a), len(b)
+    n = n1 + n2
+    combined = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+
+    # Average ranks over ties
+    rank_sum_a = 0.0
+    tie_term = 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        rank_sum_a += rank * sum(1 for k in range(i, j + 1) if combined[k][1] == 0)
+        ties = j - i + 1
+        tie_term += ties**3 - ties
+        i = j + 1
+
+    u = rank_sum_a - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = max(abs(u - mean) - 0.5, 0) / math.sqrt(variance)
+    return math.erfc(z / math.sqrt(2))
+
+
+def classify(baseline, new, threshold, alpha):
+    """Return (relative median change, p-value, status) for two sample lists."""
+    baseline_median = statistics.median(baseline)
+    new_median = statistics.median(new)
+    if baseline_median > 0:
+        change = new_median / baseline_median - 1
+    else:
+        change = 0.0 if new_median == 0 else math.inf
+    if len(baseline) < 2 or len(new) < 2:
+        return change, None, UNTESTED
+
+    p_value = mann_whitney_u(baseline, new)
+    if p_value >= alpha or abs(change) <= threshold:
+        return change, p_value, UNCHANGED
+    return change, p_value, REGRESSION if change > 0 else IMPROVEMENT
+
+
+def samples_of(result, metric_key, average_key):
+    # Results written before the raw samples were kept only carry the average
+    if metric_key in result:
+        return result[metric_key]
+    return [result[average_key]]
+
+
+def compare_results(baseline_results, new_results, threshold, alpha):
+    """Return one row per (dataset, protocol, metric) cell of the baseline.
+
+    Cells of the baseline that are absent from the new run (crashed or skipped)
+    get a MISSING row without timings.
+    """
+    baseline_cells = {(r["Dataset"], r["Protocol"]): r for r in baseline_results}
+    new_cells = {(r["Dataset"], r["Protocol"]) for r in new_results}
+    rows = [
+        {
+            "Dataset": key[0],
+            "Protocol": key[1],
+            "Metric": "-",
+            "Baseline Median (s)": None,
+            "New Median (s)": None,
+            "Change": None,
+            "p-value": None,
+            "Status": MISSING,
+        }
+        for key in baseline_cells
+        if key not in new_cells
+    ]
+    for result in new_results:
+        key = (result["Dataset"], result["Protocol"])
+        if key not in baseline_cells:
+            continue
+        baseline = baseline_cells[key]
+        for metric_name, metric_key in METRICS:
+            average_key = f"Average {metric_name} Time (s)"
+            if average_key not in baseline or average_key not in result:
+                continue
+            baseline_samples = samples_of(baseline, metric_key, average_key)
+            new_samples = samples_of(result, metric_key, average_key)
+            change, p_value, status = classify(
+                baseline_samples, new_samples, threshold, alpha
+            )
+            rows.append(
+                {
+                    "Dataset": key[0],
+                    "Protocol": key[1],
+                    "Metric": metric_name,
+                    "Baseline Median (s)": statistics.median(baseline_samples),
+                    "New Median (s)": statistics.median(new_samples),
+                    "Change": change,
+                    "p-value": p_value,
+                    "Status": status,
+                }
+            )
+    return rows
+
+
+def print_table(rows):
+    header = ["Dataset", "Protocol", "Metric", "Baseline", "New", "Change", "p", ""]
+    lines = [header]
+    for row in rows:
+        p_value = row["p-value"]
+        missing = row["Status"] == MISSING
+        lines.append(
+            [
+                row["Dataset"],
+                row["Protocol"],
+                row["Metric"],
+                "-" if missing else f"{row['Baseline Median (s)']:.6f}",
+                "-" if missing else f"{row['New Median (s)']:.6f}",
+                "-" if missing else f"{row['Change']:+.1%}",
+                "-" if p_value is None else f"{p_value:.4f}",
+                row["Status"],
+            ]
+        )
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    for line in lines:
+        print("  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip())
+
+
+def run_compare(baseline_file, new_file, threshold=0.05, alpha=0.05):
+    """Print the comparison table, return 1 if any cell regressed or is missing, else 0."""
+    _, baseline_results = load_results(baseline_file)
+    _, new_results = load_results(new_file)
+    rows = compare_results(baseline_results, new_results, threshold, alpha)
+    print_table(rows)
+
+    regressions = sum(1 for row in rows if row["Status"] == REGRESSION)
+    improvements = sum(1 for row in rows if row["Status"] == IMPROVEMENT)
+    untested = sum(1 for row in rows if row["Status"] == UNTESTED)
+    missing = sum(1 for row in rows if row["Status"] == MISSING)
+    print(
+        f"{len(rows)} cells compared: {regressions} regressions, "
+        f"{improvements} improvements, {untested} without samples, "
+        f"{missing} missing from the new run"
+    )
+    return 1 if regressions or missing else 0
@@ -0,0 +1,288 @@
+"""Concurrency scaling benchmark.
+
+Runs N threads, and separately N processes, that each load their own copy of a
+dataset and repeatedly serialize and deserialize it with one codec. Comparing
+the aggregate throughput of both modes shows whether the codec releases the
+GIL. When a free-threaded CPython is found on the PATH, the thread mode is
+repeated under it.
+"""
+
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import shutil
+import statistics
+import subprocess
+import sys
+import sysconfig
+import threading
+import time
+
+from evaluator import (
+    DATASETS_DIR,
+    OUTPUT_DIR,
+    append_to_file,
+    get_protocols,
+    get_system_info,
+    load_codec_modules,
+    load_json_dataset,
+)
+
+CONCURRENCY_OUTPUT_FILE = os.path.join(OUTPUT_DIR, "concurrency_results.json")
+FREE_THREADED_CANDIDATES = ["python3.14t", "python3.13t", "python3t"]
+MODES = ("threads", "processes")
+PROCESS_POLL_INTERVAL = 1.0  # Seconds between checks for crashed worker processes
+
+
+def is_free_threaded():
+    return bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+
+def gil_enabled():
+    # sys._is_gil_enabled only exists from 3.13 on
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def find_free_threaded_python():
+    """Path of a free-threaded interpreter on the PATH, None if there is none."""
+    for candidate in FREE_THREADED_CANDIDATES:
+        path = shutil.which(candidate)
+        if path:
+            return path
+    return None
+
+
+def find_protocol(dataset_file, protocol_name):
+    for name, serialize_func, deserialize_func in get_protocols(dataset_file):
+        if name == protocol_name:
+            return serialize_func, deserialize_func
+    raise ValueError(f"{protocol_name} is not available for {dataset_file}")
+
+
+def run_worker(dataset_path, protocol_name, iterations, barrier):
+    """Round-trip a private copy of the dataset.
+
+    Returns (start, end, latencies, size, GIL enabled). The GIL state is read
+    after the codec modules are loaded, since importing an extension that does
+    not support free-threading re-enables the GIL.
+    """
+    # Spawned processes start without the codec modules, keep them out of the timing
+    load_codec_modules()
+    dataset = load_json_dataset(dataset_path)
+    serialize_func, deserialize_func = find_protocol(
+        os.path.basename(dataset_path), protocol_name
+    )
+    latencies = []
+    barrier.wait()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        round_trip_start = time.perf_counter()
+        serialized_data = serialize_func(dataset)
+        deserialize_func(serialized_data)
+        latencies.append(time.perf_counter() - round_trip_start)
+    end = time.perf_counter()
+    return start, end, latencies, len(serialized_data), gil_enabled()
+
+
+def run_threads(workers, dataset_path, protocol_name, iterations):
+    # Before the threads start, LazyLoader is not thread-safe before 3.12
+    load_codec_modules()
+    barrier = threading.Barrier(workers)
+    results = [None] * workers
+    errors = []
+
+    def target(index):
+        try:
+            results[index] = run_worker(
+                dataset_path, protocol_name, iterations, barrier
+            )
+        except Exception as e:
+            # Record the root cause before the others see a BrokenBarrierError
+            errors.append(e)
+            barrier.abort()
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise root_cause(errors)
+    return results
+
+
+def root_cause(errors):
+    """The first error that is not a consequence of another worker aborting the barrier."""
+    for error in errors:
+        if not isinstance(error, threading.BrokenBarrierError):
+            return error
+    return errors[0]
+
+
+def _process_target(queue, barrier, dataset_path, protocol_name, iterations):
+    try:
+        queue.put(run_worker(dataset_path, protocol_name, iterations, barrier))
+    except Exception as e:
+        queue.put(e)
+        barrier.abort()
+
+
+def collect_process_results(result_queue, processes):
+    """Get one result per process, raise if a process died without putting one."""
+    results = []
+    while len(results) < len(processes):
+        try:
+            results.append(result_queue.get(timeout=PROCESS_POLL_INTERVAL))
+            continue
+        except queue.Empty:
+            pass
+        crashed = [p for p in processes if p.exitcode not in (None, 0)]
+        finished = all(p.exitcode is not None for p in processes)
+        if crashed or finished:
+            # A finished process might still have its result in flight
+            try:
+                results.append(result_queue.get(timeout=PROCESS_POLL_INTERVAL))
+                continue
+            except queue.Empty:
+                pass
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            exit_codes = [p.exitcode for p in processes]
+            raise RuntimeError(
+                f"Worker process exited without a result (exit codes {exit_codes})"
+            )
+    return results
+
+
+def run_processes(workers, dataset_path, protocol_name, iterations):
+    result_queue = multiprocessing.Queue()
+    barrier = multiprocessing.Barrier(workers)
+    processes = [
+        multiprocessing.Process(
+            target=_process_target,
+            args=(result_queue, barrier, dataset_path, protocol_name, iterations),
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    # Drain the queue before joining, a full pipe would block the children
+    try:
+        results = collect_process_results(result_queue, processes)
+    finally:
+        for process in processes:
+            process.join()
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        raise root_cause(errors)
+    return results
+
+
+def summarize(results, iterations):
+    starts, ends, latencies, sizes, gil_states = zip(*results)
+    wall_time = max(ends) - min(starts)
+    round_trips = len(results) * iterations
+    all_latencies = [latency for worker in latencies for latency in worker]
+    return {
+        "GIL Enabled": any(gil_states),
+        "Wall Time (s)": wall_time,
+        "Aggregate Throughput (round trips/s)": round_trips / wall_time,
+        "Aggregate Throughput (MB/s)": round_trips
+        * sizes[0]
+        / (1024**2)
+        / wall_time,
+        "Mean Latency (s)": statistics.mean(all_latencies),
+        "Max Latency (s)": max(all_latencies),
+        "Per-Worker Median Latency (s)": [
+            statistics.median(worker) for worker in latencies
+        ],
+    }
+
+
+def rerun_free_threaded(python, size_filter, protocol_names, iterations, max_workers):
+    print(f"Repeating the thread mode with free-threaded {python}...")
+    command = [
+        python,
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "evaluator.py"),
+        "concurrency",
+        "--size-filter",
+        size_filter,
+        "--iterations",
+        str(iterations),
+        "--max-workers",
+        str(max_workers),
+        "--modes",
+        "threads",
+        "--append",
+        "--no-free-threaded",
+    ]
+    if protocol_names:
+        command += ["--protocols", *protocol_names]
+    try:
+        subprocess.run(command, check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Free-threaded run failed: {e}")
+
+
+def run_concurrency_tests(
+    size_filter="8MB",
+    protocol_names=None,
+    iterations=5,
+    max_workers=None,
+    modes=MODES,
+    append=False,
+    free_threaded_rerun=True,
+):
+    """Measure throughput and latency for 1..max_workers threads and processes."""
+    max_workers = max_workers or os.cpu_count()
+    python_version = platform.python_version() + ("t" if is_free_threaded() else "")
+    if not append:
+        with open(CONCURRENCY_OUTPUT_FILE, "w") as f:
+            f.write(json.dumps({"system_info": get_system_info()}, indent=2) + "\n")
+
+    dataset_files = [
+        f
+        for f in sorted(os.listdir(DATASETS_DIR))
+        if f.endswith(".json") and size_filter in f
+    ]
+    print(f"Found {len(dataset_files)} Datasets matching {size_filter}...")
+
+    for dataset_file in dataset_files:
+        dataset_path = os.path.join(DATASETS_DIR, dataset_file)
+        for protocol_name, _, _ in get_protocols(dataset_file):
+            if protocol_names and protocol_name not in protocol_names:
+                continue
+            if protocol_name == "XML" and "256MB" in dataset_file:
+                continue
+            for mode in modes:
+                runner = run_threads if mode == "threads" else run_processes
+                baseline_throughput = None
+                for workers in range(1, max_workers + 1):
+                    print(f"[{dataset_file}][{protocol_name}][{mode}] {workers} workers")
+                    results = runner(workers, dataset_path, protocol_name, iterations)
+                    summary = summarize(results, iterations)
+                    throughput = summary["Aggregate Throughput (round trips/s)"]
+                    baseline_throughput = baseline_throughput or throughput
+
+                    result = {
+                        "Dataset": dataset_file,
+                        "Protocol": protocol_name,
+                        "Mode": mode,
+                        "Workers": workers,
+                        "Python": python_version,
+                        **summary,
+                        "Speedup": throughput / baseline_throughput,
+                    }
+                    append_to_file(CONCURRENCY_OUTPUT_FILE, result)
+
+    if free_threaded_rerun and not is_free_threaded():
+        python = find_free_threaded_python()
+        if python:
+            rerun_free_threaded(
+                python, size_filter, protocol_names, iterations, max_workers
+            )
+    print(f"All results saved to {CONCURRENCY_OUTPUT_FILE}")
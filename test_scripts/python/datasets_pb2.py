@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x64\x61tasets.proto\"\x1d\n\x0b\x46latIntList\x12\x0e\n\x06values\x18\x01 \x03(\x05\"\x1f\n\rFlatFloatList\x12\x0e\n\x06values\x18\x01 \x03(\x02\"\xce\x01\n\x0f\x44\x65\x65pFlatIntList\x12#\n\x04root\x18\x01 \x01(\x0b\x32\x15.DeepFlatIntList.Node\x1a\x95\x01\n\x04Node\x12&\n\x05\x63hild\x18\x01 \x01(\x0b\x32\x15.DeepFlatIntList.NodeH\x00\x12\x35\n\nvalue_list\x18\x02 \x01(\x0b\x32\x1f.DeepFlatIntList.Node.ValueListH\x00\x1a\x1b\n\tValueList\x12\x0e\n\x06values\x18\x01 \x03(\x05\x42\x11\n\x0f\x63hild_or_values\"\xd6\x01\n\x11\x44\x65\x65pFlatFloatList\x12%\n\x04root\x18\x01 \x01(\x0b\x32\x17.DeepFlatFloatList.Node\x1a\x99\x01\n\x04Node\x12(\n\x05\x63hild\x18\x01 \x01(\x0b\x32\x17.DeepFlatFloatList.NodeH\x00\x12\x37\n\nvalue_list\x18\x02 \x01(\x0b\x32!.DeepFlatFloatList.Node.ValueListH\x00\x1a\x1b\n\tValueList\x12\x0e\n\x06values\x18\x01 \x03(\x02\x42\x11\n\x0f\x63hild_or_values\"]\n\x07IntTree\x12\x1b\n\x04root\x18\x01 \x01(\x0b\x32\r.IntTree.Node\x1a\x35\n\x04Node\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x05\x12\x1f\n\x08\x63hildren\x18\x02 \x03(\x0b\x32\r.IntTree.Nodeb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x64\x61tasets.proto\"\x1d\n\x0b\x46latIntList\x12\x0e\n\x06values\x18\x01 \x03(\x05\"\x1f\n\rFlatFloatList\x12\x0e\n\x06values\x18\x01 \x03(\x02\"\xce\x01\n\x0f\x44\x65\x65pFlatIntList\x12#\n\x04root\x18\x01 \x01(\x0b\x32\x15.DeepFlatIntList.Node\x1a\x95\x01\n\x04Node\x12&\n\x05\x63hild\x18\x01 \x01(\x0b\x32\x15.DeepFlatIntList.NodeH\x00\x12\x35\n\nvalue_list\x18\x02 \x01(\x0b\x32\x1f.DeepFlatIntList.Node.ValueListH\x00\x1a\x1b\n\tValueList\x12\x0e\n\x06values\x18\x01 \x03(\x05\x42\x11\n\x0f\x63hild_or_values\"\xd6\x01\n\x11\x44\x65\x65pFlatFloatList\x12%\n\x04root\x18\x01 \x01(\x0b\x32\x17.DeepFlatFloatList.Node\x1a\x99\x01\n\x04Node\x12(\n\x05\x63hild\x18\x01 \x01(\x0b\x32\x17.DeepFlatFloatList.NodeH\x00\x12\x37\n\nvalue_list\x18\x02 \x01(\x0b\x32!.DeepFlatFloatList.Node.ValueListH\x00\x1a\x1b\n\tValueList\x12\x0e\n\x06values\x18\x01 \x03(\x02\x42\x11\n\x0f\x63hild_or_values\"]\n\x07IntTree\x12\x1b\n\x04root\x18\x01 \x01(\x0b\x32\r.IntTree.Node\x1a\x35\n\x04Node\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x05\x12\x1f\n\x08\x63hildren\x18\x02 \x03(\x0b\x32\r.IntTree.Node\"1\n\x0b\x46latIntTree\x12\x0c\n\x04\x64\x61ta\x18\x01 \x03(\x05\x12\x14\n\x0c\x63hild_counts\x18\x02 \x03(\r\"\xa0\x01\n\x06Record\x12\x1d\n\x06\x66ields\x18\x01 \x03(\x0b\x32\r.Record.Field\x1aw\n\x05\x46ield\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x14\n\nbool_value\x18\x02 \x01(\x08H\x00\x12\x13\n\tint_value\x18\x03 \x01(\x12H\x00\x12\x15\n\x0b\x66loat_value\x18\x04 \x01(\x01H\x00\x12\x16\n\x0cstring_value\x18\x05 \x01(\tH\x00\x42\x07\n\x05valueb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -51,4 +51,10 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_INTTREE']._serialized_end=601
   _globals['_INTTREE_NODE']._serialized_start=548
   _globals['_INTTREE_NODE']._serialized_end=601
+  _globals['_FLATINTTREE']._serialized_start=603
+  _globals['_FLATINTTREE']._serialized_end=652
+  _globals['_RECORD']._serialized_start=655
+  _globals['_RECORD']._serialized_end=815
+  _globals['_RECORD_FIELD']._serialized_start=696
+  _globals['_RECORD_FIELD']._serialized_end=815
 # @@protoc_insertion_point(module_scope)
@@ -1,21 +1,95 @@
 import time
+import io
 import json
 import math
 import os
 import gc
-import psutil
+import argparse
+import importlib
+import importlib.util
+import tracemalloc
+import sys
 import platform
-import datasets_pb2
-import msgpack
-from lxml import etree
 from sys import getsizeof
 
+# EVALUATOR_LAZY_IMPORTS=1 defers executing the codec modules to their first
+# use, which keeps the startup of short-lived runs cheap (see cold_start.py).
+# It stays off by default so no import cost lands inside a timed call.
+LAZY_IMPORTS = os.environ.get("EVALUATOR_LAZY_IMPORTS") == "1"
+
+
+def lazy_import(name):
+    """Return module `name`, with LAZY_IMPORTS executed only on first attribute access."""
+    if not LAZY_IMPORTS:
+        return importlib.import_module(name)
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    # Bind submodules on their package like the regular import does
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+psutil = lazy_import("psutil")
+datasets_pb2 = lazy_import("datasets_pb2")
+msgpack = lazy_import("msgpack")
+etree = lazy_import("lxml.etree")
+
+# The columnar codecs are optional
+try:
+    np = lazy_import("numpy")
+    pa = lazy_import("pyarrow")
+except ImportError:
+    np = pa = None
+
+
+def columnar_available():
+    """Execute numpy/pyarrow, disable the columnar codecs if that fails."""
+    global np, pa
+    if np is None:
+        return False
+    for name, module in (("numpy", np), ("pyarrow", pa)):
+        try:
+            getattr(module, "__name__")
+        except ImportError as e:
+            # Installed but broken, e.g. a pyarrow built against another numpy ABI
+            print(f"Columnar codecs disabled: {e}")
+            sys.modules.pop(name, None)
+            np = pa = None
+            return False
+    # The first pa.array() on a NumPy array imports pandas (~0.3 s) and the first
+    # IPC write sets up the writer, pay both here instead of in a timed repeat
+    warm_up = pa.table({"values": np.zeros(1, dtype=np.int32)})
+    _read_arrow_table(_write_arrow_table(warm_up, False), False)
+    return True
+
+
+def load_codec_modules():
+    """Execute all lazily imported modules now (LazyLoader is not thread-safe before 3.12)."""
+    for module in (psutil, datasets_pb2, msgpack, etree):
+        getattr(module, "__name__")
+    columnar_available()
+
+
 # Configuration
 DATASETS_DIR = "datasets"
 OUTPUT_DIR = "serialization_test_results"
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "results.json")
 XML_THRESHOLD_MB = 20000
 REPEATS = 10  # Number of repetitions per test
+STREAMING_OUTPUT_FILE = os.path.join(OUTPUT_DIR, "streaming_results.json")
+STREAMING_TEMP_FILE = os.path.join(OUTPUT_DIR, "temp.msgpack")
+STREAM_BUFFER_SIZE = 1024 * 1024  # Flush threshold of the streaming packer (bytes)
+STREAM_CHUNK_SIZE = 1024 * 1024  # Chunk size fed into the streaming unpacker (bytes)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
@@ -64,6 +138,109 @@ def deserialize_msgpack(data):
     return msgpack.unpackb(data, raw=False)
 
 
+# Streaming MessagePack
+#
+# Stream layout: a msgpack array holding the keys of the single-key wrapper
+# dicts around the payload (the "child" chain of the deep datasets, empty for
+# flat data), followed by an array header and the array elements packed one
+# by one. Only the outermost list is streamed; its elements are packed whole.
+def _split_stream_path(data):
+    """Walk single-key wrappers down to the list that gets streamed."""
+    path = []
+    while isinstance(data, dict) and len(data) == 1:
+        key, value = next(iter(data.items()))
+        if not isinstance(value, (dict, list)):
+            break
+        path.append(key)
+        data = value
+    if not isinstance(data, list):
+        raise ValueError("Streaming MessagePack requires a list payload")
+    return path, data
+
+
+def stream_msgpack(data, f, buffer_size=STREAM_BUFFER_SIZE):
+    """Pack `data` incrementally into the binary file `f`, flushing every `buffer_size` bytes."""
+    path, items = _split_stream_path(data)
+    packer = msgpack.Packer(autoreset=False)
+    packer.pack(path)
+    packer.pack_array_header(len(items))
+    written = 0
+    for i, item in enumerate(items):
+        packer.pack(item)
+        # Checking the buffer costs more than packing a scalar, so only look every 1024 items
+        if i & 1023 == 1023 and len(packer.getbuffer()) >= buffer_size:
+            written += f.write(packer.getbuffer())
+            packer.reset()
+    written += f.write(packer.getbuffer())
+    packer.reset()
+    return written
+
+
+def iter_msgpack_stream(chunks):
+    """Feed `chunks` into an Unpacker; yield the wrapper path first, then each element."""
+    unpacker = msgpack.Unpacker(raw=False)
+    path = remaining = None
+
+    for chunk in chunks:
+        unpacker.feed(chunk)
+        try:
+            if path is None:
+                path = unpacker.unpack()
+                yield path
+            if remaining is None:
+                remaining = unpacker.read_array_header()
+            while remaining:
+                item = unpacker.unpack()
+                remaining -= 1
+                yield item
+        except msgpack.OutOfData:
+            continue  # Element spans the chunk boundary, wait for more data
+
+    if remaining is None or remaining:
+        raise ValueError("Truncated MessagePack stream")
+
+
+def read_chunks(f, chunk_size=STREAM_CHUNK_SIZE):
+    """Yield fixed-size chunks from the binary file `f`."""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def serialize_msgpack_stream(data):
+    buffer = io.BytesIO()
+    stream_msgpack(data, buffer)
+    return buffer.getvalue()
+
+
+def deserialize_msgpack_stream(data):
+    view = memoryview(data)
+    elements = iter_msgpack_stream(
+        view[i : i + STREAM_CHUNK_SIZE] for i in range(0, len(view), STREAM_CHUNK_SIZE)
+    )
+    path = next(elements)
+    result = list(elements)
+    for key in reversed(path):
+        result = {key: result}
+    return result
+
+
+def serialize_msgpack_stream_file(data):
+    with open(STREAMING_TEMP_FILE, "wb") as f:
+        stream_msgpack(data, f)
+    return STREAMING_TEMP_FILE
+
+
+def deserialize_msgpack_stream_file(path):
+    """Decode the stream chunk by chunk, counting elements instead of keeping them."""
+    with open(path, "rb") as f:
+        elements = iter_msgpack_stream(read_chunks(f))
+        next(elements)  # Wrapper path
+        return sum(1 for _ in elements)
+
+
 def serialize_xml(data):
     def build_xml(element, data):
         if isinstance(data, dict):
@@ -207,6 +384,265 @@ def deserialize_int_tree(data):
     return parse_tree(proto_data.root)
 
 
+def serialize_flat_int_tree(data):
+    """Iterative pre-order walk into the flattened FlatIntTree message."""
+    values = []
+    child_counts = []
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        children = node[1]["children"]
+        values.append(node[0]["data"])
+        child_counts.append(len(children))
+        stack.extend(reversed(children))
+
+    proto_data = datasets_pb2.FlatIntTree()
+    proto_data.data.extend(values)
+    proto_data.child_counts.extend(child_counts)
+    return proto_data.SerializeToString()
+
+
+def deserialize_flat_int_tree(data):
+    """Rebuild the nested tree (same shape as deserialize_int_tree) without recursion."""
+    proto_data = datasets_pb2.FlatIntTree()
+    proto_data.ParseFromString(data)
+    values = list(proto_data.data)
+    child_counts = list(proto_data.child_counts)
+
+    root = {"data": values[0], "children": []}
+    # (node, children still to attach)
+    stack = [(root, child_counts[0])]
+    for value, child_count in zip(values[1:], child_counts[1:]):
+        while stack[-1][1] == 0:
+            stack.pop()
+        parent, remaining = stack[-1]
+        stack[-1] = (parent, remaining - 1)
+        node = {"data": value, "children": []}
+        parent["children"].append(node)
+        stack.append((node, child_count))
+    return root
+
+
+def serialize_record(data):
+    """Encode one small record, a list of single-key dicts."""
+    proto_data = datasets_pb2.Record()
+    for field in data:
+        (key, value), = field.items()
+        proto_field = proto_data.fields.add()
+        proto_field.key = key
+        # bool is a subclass of int, check it first
+        if isinstance(value, bool):
+            proto_field.bool_value = value
+        elif isinstance(value, int):
+            proto_field.int_value = value
+        elif isinstance(value, float):
+            proto_field.float_value = value
+        else:
+            proto_field.string_value = value
+    return proto_data.SerializeToString()
+
+
+def deserialize_record(data):
+    proto_data = datasets_pb2.Record()
+    proto_data.ParseFromString(data)
+    return [
+        {field.key: getattr(field, field.WhichOneof("value"))}
+        for field in proto_data.fields
+    ]
+
+
+# Columnar codecs (Apache Arrow IPC / NumPy .npy)
+#
+# Flat lists become a single int32/float32 column, matching the ProtoBuf
+# schema. Deep lists become one list<...> column holding the innermost list,
+# with the wrapper keys stored in the schema metadata. Int trees become pre-order
+# "data" and "parent" index columns. Deserialization returns NumPy views onto
+# the serialized buffer instead of Python lists.
+def flatten_int_tree(data):
+    """Iterative pre-order walk returning (values, parent indices), root parent is -1."""
+    values = []
+    parents = []
+    stack = [(data, -1)]
+    while stack:
+        node, parent = stack.pop()
+        index = len(values)
+        values.append(node[0]["data"])
+        parents.append(parent)
+        for child in reversed(node[1]["children"]):
+            stack.append((child, index))
+    return values, parents
+
+
+def _write_arrow_table(table, file_format):
+    sink = pa.BufferOutputStream()
+    if file_format:
+        writer = pa.ipc.new_file(sink, table.schema)
+    else:
+        writer = pa.ipc.new_stream(sink, table.schema)
+    with writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _read_arrow_table(data, file_format):
+    source = pa.py_buffer(data)
+    if file_format:
+        return pa.ipc.open_file(source).read_all()
+    return pa.ipc.open_stream(source).read_all()
+
+
+def _column_view(table, name):
+    return table.column(name).chunk(0).to_numpy(zero_copy_only=True)
+
+
+def _make_arrow_flat_list(dtype, file_format):
+    def serialize(data):
+        table = pa.table({"values": np.asarray(data, dtype=dtype)})
+        return _write_arrow_table(table, file_format)
+
+    def deserialize(data):
+        return _column_view(_read_arrow_table(data, file_format), "values")
+
+    return serialize, deserialize
+
+
+def _make_arrow_deep_flat_list(dtype, file_format):
+    def serialize(data):
+        path, items = _split_stream_path(data)
+        values = pa.array(np.asarray(items, dtype=dtype))
+        offsets = pa.array([0, len(values)], type=pa.int32())
+        column = pa.ListArray.from_arrays(offsets, values)
+        table = pa.table({"values": column}).replace_schema_metadata(
+            {"path": json.dumps(path)}
+        )
+        return _write_arrow_table(table, file_format)
+
+    def deserialize(data):
+        table = _read_arrow_table(data, file_format)
+        path = json.loads(table.schema.metadata[b"path"])
+        result = table.column("values").chunk(0).values.to_numpy(zero_copy_only=True)
+        for key in reversed(path):
+            result = {key: result}
+        return result
+
+    return serialize, deserialize
+
+
+def _make_arrow_int_tree(file_format):
+    def serialize(data):
+        values, parents = flatten_int_tree(data)
+        table = pa.table(
+            {
+                "data": np.asarray(values, dtype=np.int32),
+                "parent": np.asarray(parents, dtype=np.int32),
+            }
+        )
+        return _write_arrow_table(table, file_format)
+
+    def deserialize(data):
+        table = _read_arrow_table(data, file_format)
+        return {
+            "data": _column_view(table, "data"),
+            "parent": _column_view(table, "parent"),
+        }
+
+    return serialize, deserialize
+
+
+def _make_npy_flat_list(dtype):
+    def serialize(data):
+        buffer = io.BytesIO()
+        np.save(buffer, np.asarray(data, dtype=dtype), allow_pickle=False)
+        return buffer.getvalue()
+
+    def deserialize(data):
+        header = io.BytesIO(data)
+        if np.lib.format.read_magic(header) == (1, 0):
+            read_header = np.lib.format.read_array_header_1_0
+        else:
+            read_header = np.lib.format.read_array_header_2_0
+        shape, fortran_order, dtype_read = read_header(header)
+        return np.frombuffer(
+            data, dtype=dtype_read, count=math.prod(shape), offset=header.tell()
+        ).reshape(shape, order="F" if fortran_order else "C")
+
+    return serialize, deserialize
+
+
+def get_columnar_protocols(dataset_file):
+    """Columnar protocols applicable to a dataset, empty if numpy/pyarrow are unusable."""
+    if not columnar_available():
+        return []
+
+    if "deep_flat_intlist" in dataset_file:
+        arrow = lambda f: _make_arrow_deep_flat_list(np.int32, f)
+        npy = None
+    elif "flat_intlist" in dataset_file:
+        arrow = lambda f: _make_arrow_flat_list(np.int32, f)
+        npy = _make_npy_flat_list(np.int32)
+    elif "deep_flat_floatlist" in dataset_file:
+        arrow = lambda f: _make_arrow_deep_flat_list(np.float32, f)
+        npy = None
+    elif "flat_floatlist" in dataset_file:
+        arrow = lambda f: _make_arrow_flat_list(np.float32, f)
+        npy = _make_npy_flat_list(np.float32)
+    elif "int_tree" in dataset_file:
+        arrow = _make_arrow_int_tree
+        npy = None
+    else:
+        return []
+
+    protocols = [
+        ("Arrow IPC (stream)", *arrow(False)),
+        ("Arrow IPC (file)", *arrow(True)),
+    ]
+    if npy is not None:
+        protocols.append(("NumPy (.npy)", *npy))
+    return protocols
+
+
+def get_protocols(dataset_file):
+    """Return (name, serialize, deserialize) for every protocol applicable to a dataset."""
+    # Assign Protobuf functions based on dataset type
+    if "deep_flat_intlist" in dataset_file:
+        serialize_func, deserialize_func = (
+            serialize_deep_flat_int_list,
+            deserialize_deep_flat_int_list,
+        )
+    elif "flat_intlist" in dataset_file:
+        serialize_func, deserialize_func = (
+            serialize_flat_int_list,
+            deserialize_flat_int_list,
+        )
+    elif "deep_flat_floatlist" in dataset_file:
+        serialize_func, deserialize_func = (
+            serialize_deep_flat_float_list,
+            deserialize_deep_flat_float_list,
+        )
+    elif "flat_floatlist" in dataset_file:
+        serialize_func, deserialize_func = (
+            serialize_flat_float_list,
+            deserialize_flat_float_list,
+        )
+    elif "int_tree" in dataset_file:
+        serialize_func, deserialize_func = serialize_int_tree, deserialize_int_tree
+    else:
+        return []
+
+    protocols = [
+        ("JSON", serialize_json, deserialize_json),
+        ("XML", serialize_xml, deserialize_xml),
+        ("MessagePack", serialize_msgpack, deserialize_msgpack),
+        ("ProtoBuf", serialize_func, deserialize_func),
+    ]
+    if "int_tree" in dataset_file:
+        protocols.append(
+            ("ProtoBuf (flat)", serialize_flat_int_tree, deserialize_flat_int_tree)
+        )
+    protocols.extend(get_columnar_protocols(dataset_file))
+    return protocols
+
+
 # Time measurement
 def measure_time(func, *args):
     start = time.perf_counter()
@@ -215,6 +651,18 @@ def measure_time(func, *args):
     return result, end - start
 
 
+# Peak memory measurement (Python allocator, includes msgpack/protobuf C buffers)
+def measure_peak_memory(func, *args):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
 # Append results to file
 def append_to_file(filepath, data):
     with open(filepath, "a") as f:
@@ -222,6 +670,9 @@ def append_to_file(filepath, data):
 
 
 def run_tests():
+    # Keep lazily imported modules out of the first timed repeat
+    load_codec_modules()
+
     # Write system info at the beginning
     system_info = get_system_info()
     with open(OUTPUT_FILE, "w") as f:
@@ -240,39 +691,10 @@ def run_tests():
         dataset_size_mb = in_memory_size / math.pow(1024, 2)
         print(f"Loaded with {dataset_size_mb:.2f} MB")
 
-        # Assign Protobuf functions based on dataset type
-        if "deep_flat_intlist" in dataset_file:
-            serialize_func, deserialize_func = (
-                serialize_deep_flat_int_list,
-                deserialize_deep_flat_int_list,
-            )
-        elif "flat_intlist" in dataset_file:
-            serialize_func, deserialize_func = (
-                serialize_flat_int_list,
-                deserialize_flat_int_list,
-            )
-        elif "deep_flat_floatlist" in dataset_file:
-            serialize_func, deserialize_func = (
-                serialize_deep_flat_float_list,
-                deserialize_deep_flat_float_list,
-            )
-        elif "flat_floatlist" in dataset_file:
-            serialize_func, deserialize_func = (
-                serialize_flat_float_list,
-                deserialize_flat_float_list,
-            )
-        elif "int_tree" in dataset_file:
-            serialize_func, deserialize_func = serialize_int_tree, deserialize_int_tree
-        else:
+        protocols = get_protocols(dataset_file)
+        if not protocols:
             continue
 
-        protocols = [
-            ("JSON", serialize_json, deserialize_json),
-            ("XML", serialize_xml, deserialize_xml),
-            ("MessagePack", serialize_msgpack, deserialize_msgpack),
-            ("ProtoBuf", serialize_func, deserialize_func),
-        ]
-
         for protocol_name, serialize_func, deserialize_func in protocols:
 
             if protocol_name == "XML" and "256MB" in dataset_file:
@@ -322,6 +744,8 @@ def run_tests():
                 "Compression Ratio": compression_ratio,
                 "Average Serialization Time (s)": avg_serialization_time,
                 "Average Deserialization Time (s)": avg_deserialization_time,
+                "Serialization Times (s)": serialization_times,
+                "Deserialization Times (s)": deserialization_times,
             }
             append_to_file(OUTPUT_FILE, result)
             print(f"Result appended for {protocol_name}")
@@ -333,5 +757,229 @@ def run_tests():
     print(f"All results saved to {OUTPUT_FILE}")
 
 
+def run_streaming_tests(size_filter="256MB"):
+    """Compare one-shot packb/unpackb against the streaming Packer/Unpacker codec."""
+    load_codec_modules()
+    system_info = get_system_info()
+    with open(STREAMING_OUTPUT_FILE, "w") as f:
+        f.write(json.dumps({"system_info": system_info}, indent=2) + "\n")
+
+    dataset_files = [
+        f
+        for f in os.listdir(DATASETS_DIR)
+        if f.endswith(".json") and size_filter in f
+    ]
+    file_amount = len(dataset_files)
+    print(f"Found {file_amount} Datasets matching {size_filter}...")
+
+    # The in-memory rows are like-for-like, both build the full decoded object.
+    # The file row adds disk I/O and only counts the decoded elements.
+    protocols = [
+        (
+            "MessagePack",
+            serialize_msgpack,
+            deserialize_msgpack,
+            "in-memory, decodes into the full object",
+        ),
+        (
+            "MessagePack (stream)",
+            serialize_msgpack_stream,
+            deserialize_msgpack_stream,
+            "in-memory, decodes into the full object",
+        ),
+        (
+            "MessagePack (stream, file)",
+            serialize_msgpack_stream_file,
+            deserialize_msgpack_stream_file,
+            "includes file I/O, decoded elements are counted and discarded",
+        ),
+    ]
+
+    for i, dataset_file in enumerate(dataset_files):
+        dataset_path = os.path.join(DATASETS_DIR, dataset_file)
+        print(f"[{i+1}|{file_amount}] Loading {dataset_file}")
+        dataset = load_json_dataset(dataset_path)
+
+        for protocol_name, serialize_func, deserialize_func, notes in protocols:
+            print(f"Testing {protocol_name}...")
+            serialization_times = []
+            deserialization_times = []
+
+            for repeat in range(REPEATS):
+                print(f"[{dataset_file}][{protocol_name}][{repeat+1}|{REPEATS}]")
+                serialized_data, serialization_time = measure_time(
+                    serialize_func, dataset
+                )
+                serialization_times.append(serialization_time)
+                _, deserialization_time = measure_time(
+                    deserialize_func, serialized_data
+                )
+                deserialization_times.append(deserialization_time)
+                del serialized_data
+
+            # Separate traced run, tracemalloc slows down every allocation
+            serialized_data, serialization_peak = measure_peak_memory(
+                serialize_func, dataset
+            )
+            _, deserialization_peak = measure_peak_memory(
+                deserialize_func, serialized_data
+            )
+            if protocol_name == "MessagePack (stream, file)":
+                size = os.path.getsize(serialized_data)
+            else:
+                size = len(serialized_data)
+            del serialized_data
+
+            avg_serialization_time = sum(serialization_times) / REPEATS
+            avg_deserialization_time = sum(deserialization_times) / REPEATS
+            size_mb = size / math.pow(1024, 2)
+
+            result = {
+                "Dataset": dataset_file,
+                "Protocol": protocol_name,
+                "Notes": notes,
+                "Serialized Size (bytes)": size,
+                "Average Serialization Time (s)": avg_serialization_time,
+                "Average Deserialization Time (s)": avg_deserialization_time,
+                "Serialization Times (s)": serialization_times,
+                "Deserialization Times (s)": deserialization_times,
+                "Serialization Throughput (MB/s)": size_mb / avg_serialization_time,
+                "Deserialization Throughput (MB/s)": size_mb
+                / avg_deserialization_time,
+                "Peak Serialization Memory (bytes)": serialization_peak,
+                "Peak Deserialization Memory (bytes)": deserialization_peak,
+            }
+            append_to_file(STREAMING_OUTPUT_FILE, result)
+            print(f"Result appended for {protocol_name}")
+
+        del dataset
+        gc.collect()
+
+    if os.path.exists(STREAMING_TEMP_FILE):
+        os.remove(STREAMING_TEMP_FILE)
+    print(f"All results saved to {STREAMING_OUTPUT_FILE}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serialization benchmark evaluator")
+    subparsers = parser.add_subparsers(dest="command")
+
+    streaming_parser = subparsers.add_parser(
+        "streaming", help="Compare one-shot and streaming MessagePack"
+    )
+    streaming_parser.add_argument(
+        "--size-filter",
+        default="256MB",
+        help="Only test datasets whose file name contains this string",
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Detect performance regressions between two result sets"
+    )
+    compare_parser.add_argument("baseline", help="Baseline results file")
+    compare_parser.add_argument(
+        "new", nargs="?", help="New results file, runs the benchmark when omitted"
+    )
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="Relative change of the median time that counts (default: 0.05)",
+    )
+    compare_parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.05,
+        help="Significance level of the Mann-Whitney U test (default: 0.05)",
+    )
+
+    concurrency_parser = subparsers.add_parser(
+        "concurrency", help="Throughput scaling over threads and processes"
+    )
+    concurrency_parser.add_argument("--size-filter", default="8MB")
+    concurrency_parser.add_argument(
+        "--protocols", nargs="*", help="Protocol names, defaults to all"
+    )
+    concurrency_parser.add_argument(
+        "--iterations", type=int, default=5, help="Round trips per worker"
+    )
+    concurrency_parser.add_argument(
+        "--max-workers", type=int, help="Defaults to the CPU count"
+    )
+    concurrency_parser.add_argument(
+        "--modes", nargs="+", choices=["threads", "processes"], default=["threads", "processes"]
+    )
+    concurrency_parser.add_argument(
+        "--append", action="store_true", help="Append to existing results"
+    )
+    concurrency_parser.add_argument(
+        "--no-free-threaded",
+        action="store_true",
+        help="Do not repeat the thread mode with a free-threaded interpreter",
+    )
+
+    small_messages_parser = subparsers.add_parser(
+        "small-messages", help="Per-message latency over small key-value records"
+    )
+    small_messages_parser.add_argument(
+        "--messages", type=int, default=1_000_000, help="Messages per protocol"
+    )
+    small_messages_parser.add_argument(
+        "--protocols", nargs="*", help="Protocol names, defaults to all"
+    )
+
+    cold_start_parser = subparsers.add_parser(
+        "cold-start", help="Import, descriptor setup and first-call latency"
+    )
+    cold_start_parser.add_argument(
+        "--dataset", default="dataset_int_tree_small.json", help="Dataset file name"
+    )
+    cold_start_parser.add_argument(
+        "--calls", type=int, default=100, help="Calls per fresh interpreter"
+    )
+    cold_start_parser.add_argument(
+        "--repeats", type=int, default=5, help="Fresh interpreters per protocol"
+    )
+    cold_start_parser.add_argument(
+        "--protocols", nargs="*", help="Protocol names, defaults to all"
+    )
+
+    args = parser.parse_args()
+    if args.command == "streaming":
+        run_streaming_tests(args.size_filter)
+    elif args.command == "compare":
+        from compare_results import run_compare
+
+        new_file = args.new
+        if new_file is None:
+            if os.path.abspath(args.baseline) == os.path.abspath(OUTPUT_FILE):
+                parser.error(f"Copy the baseline away from {OUTPUT_FILE} first")
+            run_tests()
+            new_file = OUTPUT_FILE
+        sys.exit(run_compare(args.baseline, new_file, args.threshold, args.alpha))
+    elif args.command == "concurrency":
+        from concurrency import run_concurrency_tests
+
+        run_concurrency_tests(
+            args.size_filter,
+            args.protocols,
+            args.iterations,
+            args.max_workers,
+            args.modes,
+            args.append,
+            not args.no_free_threaded,
+        )
+    elif args.command == "small-messages":
+        from small_messages import run_small_message_tests
+
+        run_small_message_tests(args.messages, args.protocols)
+    elif args.command == "cold-start":
+        from cold_start import run_cold_start_tests
+
+        run_cold_start_tests(args.dataset, args.calls, args.repeats, args.protocols)
+    else:
+        run_tests()
+
+
 if __name__ == "__main__":
-    run_tests()
+    main()
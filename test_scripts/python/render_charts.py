@@ -0,0 +1,178 @@
+"""Headless chart renderer for the serialization benchmark results.
+
+Renders the visualizer_pro charts and the overview figures of visualizer.py and
+visualizer_log.py on the Agg backend in a process pool and writes them straight
+to disk. Every figure is closed right after it is saved,
+and charts whose input records have not changed since the last export are
+skipped based on a hash stored in the output directory.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+import visualizer
+import visualizer_log
+import visualizer_pro
+from results_io import load_results
+
+MANIFEST_FILE = ".render_manifest.json"
+COMBINED_COMPRESSION_CHART = "combined_compression_ratios"
+OVERVIEW_MODULES = {
+    module.CHART_NAME: module for module in (visualizer, visualizer_log)
+}
+
+
+def hash_inputs(*inputs):
+    payload = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_manifest(output_dir, manifest):
+    with open(os.path.join(output_dir, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def save_and_close(output_dir, chart_name, fig):
+    path = os.path.join(output_dir, visualizer_pro.chart_filename(chart_name))
+    fig.savefig(path)
+    plt.close(fig)
+    return path
+
+
+def render_dataset_charts(output_dir, dataset_name, protocols, separate_mode):
+    figures = visualizer_pro.create_chart(dataset_name, protocols, separate_mode)
+    return [save_and_close(output_dir, name, fig) for name, fig in figures]
+
+
+def render_compression_chart(output_dir, datasets):
+    fig = visualizer_pro.create_combined_compression_chart(datasets)
+    return [save_and_close(output_dir, COMBINED_COMPRESSION_CHART, fig)]
+
+
+def render_overview_chart(output_dir, chart_name, system_info, results):
+    fig = OVERVIEW_MODULES[chart_name].create_figure(system_info, results)
+    return [save_and_close(output_dir, chart_name, fig)]
+
+
+def build_jobs(output_dir, system_info, results, separate_mode):
+    """Return (key, input hash, render function, arguments) for every chart group."""
+    datasets = visualizer_pro.group_by_dataset(results)
+    settings = {
+        "separate_mode": separate_mode,
+        "labels_as_legend": visualizer_pro.labels_as_legend,
+    }
+    jobs = []
+    for dataset_name, protocols in datasets.items():
+        jobs.append(
+            (
+                dataset_name,
+                hash_inputs(settings, protocols),
+                render_dataset_charts,
+                (output_dir, dataset_name, protocols, separate_mode),
+            )
+        )
+    if not separate_mode:
+        jobs.append(
+            (
+                COMBINED_COMPRESSION_CHART,
+                hash_inputs(settings, datasets),
+                render_compression_chart,
+                (output_dir, datasets),
+            )
+        )
+    for chart_name in OVERVIEW_MODULES:
+        jobs.append(
+            (
+                chart_name,
+                hash_inputs(system_info, results),
+                render_overview_chart,
+                (output_dir, chart_name, system_info, results),
+            )
+        )
+    return jobs
+
+
+def is_up_to_date(entry, input_hash):
+    return (
+        entry is not None
+        and entry["hash"] == input_hash
+        and all(os.path.exists(path) for path in entry["files"])
+    )
+
+
+def render_all(results_file, output_dir, separate_mode, workers=None, force=False):
+    """Render all charts that are out of date, return the number of failed jobs."""
+    system_info, results = load_results(results_file)
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest = {} if force else load_manifest(output_dir)
+    all_jobs = build_jobs(output_dir, system_info, results, separate_mode)
+    jobs = [
+        job for job in all_jobs if not is_up_to_date(manifest.get(job[0]), job[1])
+    ]
+    print(f"{len(jobs)} of {len(all_jobs)} chart groups out of date")
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(render_func, *render_args): (key, input_hash)
+            for key, input_hash, render_func, render_args in jobs
+        }
+        for future in as_completed(futures):
+            key, input_hash = futures[future]
+            try:
+                files = future.result()
+            except Exception as e:
+                print(f"Rendering {key} failed: {e}")
+                manifest.pop(key, None)
+                failures += 1
+                continue
+            manifest[key] = {"hash": input_hash, "files": files}
+            print(f"Rendered {key}: {', '.join(files)}")
+
+    save_manifest(output_dir, manifest)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render benchmark charts headless")
+    parser.add_argument("results", nargs="?", default=visualizer_pro.RESULTS_FILE)
+    parser.add_argument("--output-dir", help="Defaults to the visualizer_pro directory")
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help="Combined time charts and the grouped compression chart",
+    )
+    parser.add_argument("--workers", type=int, help="Defaults to the CPU count")
+    parser.add_argument(
+        "--force", action="store_true", help="Re-render unchanged charts"
+    )
+    args = parser.parse_args()
+
+    separate_mode = not args.combined
+    output_dir = args.output_dir or visualizer_pro.get_output_dir(separate_mode)
+    failures = render_all(
+        args.results, output_dir, separate_mode, args.workers, args.force
+    )
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Reading benchmark result files.
+
+Kept free of codec and plotting imports so chart and comparison scripts can
+load results cheaply.
+"""
+
+import json
+
+
+# Load a results file written by append_to_file (or a JSON array from the Rust evaluator)
+def load_results(filepath):
+    """Return (system_info, result records) of a results file."""
+    with open(filepath, "r") as f:
+        content = f.read()
+
+    decoder = json.JSONDecoder()
+    records = []
+    position = 0
+    while position < len(content):
+        if content[position].isspace():
+            position += 1
+            continue
+        record, position = decoder.raw_decode(content, position)
+        if isinstance(record, list):
+            records.extend(record)
+        else:
+            records.append(record)
+
+    system_info = {}
+    results = []
+    for record in records:
+        if "system_info" in record:
+            system_info = record["system_info"]
+        else:
+            results.append(record)
+    return system_info, results
@@ -0,0 +1,176 @@
+"""Small-message tail-latency benchmark.
+
+Encodes and decodes a stream of small key-value records (dataset_small_records_*,
+~100 B to ~4 KB each, mixed ints, floats, strings and bools) one record per
+call. Every call is timed and recorded in an HDR-style histogram, which keeps
+the tail percentiles accurate to within 2% without storing every sample.
+"""
+
+import itertools
+import json
+import math
+import os
+import time
+
+from evaluator import (
+    DATASETS_DIR,
+    OUTPUT_DIR,
+    append_to_file,
+    deserialize_json,
+    deserialize_msgpack,
+    deserialize_record,
+    deserialize_xml,
+    get_system_info,
+    load_json_dataset,
+    serialize_json,
+    serialize_msgpack,
+    serialize_record,
+    serialize_xml,
+)
+
+SMALL_MESSAGES_OUTPUT_FILE = os.path.join(OUTPUT_DIR, "small_messages_results.json")
+SMALL_MESSAGE_PROTOCOLS = [
+    ("JSON", serialize_json, deserialize_json),
+    ("XML", serialize_xml, deserialize_xml),
+    ("MessagePack", serialize_msgpack, deserialize_msgpack),
+    ("ProtoBuf", serialize_record, deserialize_record),
+]
+PERCENTILES = [50, 99, 99.9]
+
+
+class LatencyHistogram:
+    """Log-linear histogram of nanosecond values in the style of HdrHistogram.
+
+    Values below 2**SUB_BUCKET_BITS are counted exactly. Above that every power
+    of two is split into 2**(SUB_BUCKET_BITS - 1) linear buckets, so a bucket
+    is never wider than 1/64 of its value.
+    """
+
+    SUB_BUCKET_BITS = 7
+
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+        self.max_value = 0
+
+    def bucket_index(self, value):
+        magnitude = value.bit_length() - self.SUB_BUCKET_BITS
+        if magnitude <= 0:
+            return value
+        return (magnitude << (self.SUB_BUCKET_BITS - 1)) + (value >> magnitude)
+
+    def highest_equivalent_value(self, index):
+        if index < 1 << self.SUB_BUCKET_BITS:
+            return index
+        magnitude = (index >> (self.SUB_BUCKET_BITS - 1)) - 1
+        mantissa = index - (magnitude << (self.SUB_BUCKET_BITS - 1))
+        return ((mantissa + 1) << magnitude) - 1
+
+    def record(self, value):
+        index = self.bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        if value > self.max_value:
+            self.max_value = value
+
+    def value_at_percentile(self, percentile):
+        target = max(1, -(-self.total * percentile // 100))  # Ceiling
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self.highest_equivalent_value(index), self.max_value)
+        return self.max_value
+
+
+def summarize(histogram, total_ns):
+    summary = {
+        f"p{percentile} Latency (s)": histogram.value_at_percentile(percentile) / 1e9
+        for percentile in PERCENTILES
+    }
+    summary["Max Latency (s)"] = histogram.max_value / 1e9
+    summary["Messages per Second"] = histogram.total / (total_ns / 1e9)
+    return summary
+
+
+def run_small_message_tests(messages=1_000_000, protocol_names=None):
+    """Encode and decode `messages` records one per call for every protocol."""
+    with open(SMALL_MESSAGES_OUTPUT_FILE, "w") as f:
+        f.write(json.dumps({"system_info": get_system_info()}, indent=2) + "\n")
+
+    dataset_files = [
+        f
+        for f in sorted(os.listdir(DATASETS_DIR))
+        if f.endswith(".json") and "small_records" in f
+    ]
+    print(f"Found {len(dataset_files)} small record Datasets...")
+
+    for dataset_file in dataset_files:
+        print(f"Loading {dataset_file}")
+        records = load_json_dataset(os.path.join(DATASETS_DIR, dataset_file))
+
+        for protocol_name, serialize_func, deserialize_func in SMALL_MESSAGE_PROTOCOLS:
+            if protocol_names and protocol_name not in protocol_names:
+                continue
+            print(f"[{dataset_file}][{protocol_name}] {messages} messages")
+
+            # Warm-up pass, also makes sure the codec can encode every record
+            try:
+                for record in records:
+                    deserialize_func(serialize_func(record))
+            except ValueError as e:
+                # e.g. keys that are no valid XML tag names
+                print(f"{protocol_name} failed on {dataset_file}: {e}")
+                append_to_file(
+                    SMALL_MESSAGES_OUTPUT_FILE,
+                    {"Dataset": dataset_file, "Protocol": protocol_name, "Error": str(e)},
+                )
+                continue
+
+            serialization_histogram = LatencyHistogram()
+            deserialization_histogram = LatencyHistogram()
+            serialization_total = deserialization_total = 0
+            total_size = max_size = 0
+            min_size = math.inf
+
+            for record in itertools.islice(itertools.cycle(records), messages):
+                start = time.perf_counter_ns()
+                serialized_data = serialize_func(record)
+                middle = time.perf_counter_ns()
+                deserialize_func(serialized_data)
+                end = time.perf_counter_ns()
+
+                serialization_histogram.record(middle - start)
+                deserialization_histogram.record(end - middle)
+                serialization_total += middle - start
+                deserialization_total += end - middle
+
+                size = len(serialized_data)
+                total_size += size
+                min_size = min(min_size, size)
+                max_size = max(max_size, size)
+
+            result = {
+                "Dataset": dataset_file,
+                "Protocol": protocol_name,
+                "Messages": messages,
+                "Average Serialized Size (bytes)": total_size / messages,
+                "Min Serialized Size (bytes)": min_size,
+                "Max Serialized Size (bytes)": max_size,
+                "Serialization": summarize(
+                    serialization_histogram, serialization_total
+                ),
+                "Deserialization": summarize(
+                    deserialization_histogram, deserialization_total
+                ),
+            }
+            append_to_file(SMALL_MESSAGES_OUTPUT_FILE, result)
+            print(
+                f"{protocol_name}: "
+                f"{result['Serialization']['Messages per Second']:.0f} msg/s encode, "
+                f"{result['Deserialization']['Messages per Second']:.0f} msg/s decode, "
+                f"p99.9 {result['Serialization']['p99.9 Latency (s)'] * 1e6:.1f} us / "
+                f"{result['Deserialization']['p99.9 Latency (s)'] * 1e6:.1f} us"
+            )
+
+    print(f"All results saved to {SMALL_MESSAGES_OUTPUT_FILE}")
@@ -1,21 +1,14 @@
-import json
 import pandas as pd
 import matplotlib.pyplot as plt
 
-# Load results
-with open("serialization_test_results/results.json", "r") as file:
-    data = json.load(file)
+from results_io import load_results
 
-system_info = data[0]["system_info"]
-results = pd.DataFrame(data[1:])
-
-# Separate datasets into two groups: large and small datasets
-large_datasets = results[results["Dataset"].str.contains("256MB")]
-small_datasets = results[~results["Dataset"].str.contains("256MB")]
+RESULTS_FILE = "serialization_test_results/results.json"
+CHART_NAME = "serialization_visualization_split"
 
 
 # Plot system information
-def display_system_info(ax):
+def display_system_info(ax, system_info):
     sys_text = "\n".join([f"{key}: {value}" for key, value in system_info.items()])
     ax.text(
         0.1,
@@ -30,7 +23,7 @@ def display_system_info(ax):
 
 
 # Plot compression ratio
-def plot_compression_ratio(ax):
+def plot_compression_ratio(ax, results):
     pivot_data = results.pivot(
         index="Dataset", columns="Protocol", values="Compression Ratio"
     )
@@ -44,6 +37,10 @@ def plot_compression_ratio(ax):
 
 # Plot serialization time
 def plot_serialization_time(ax, dataset, title):
+    if dataset.empty:  # e.g. no 256MB datasets in this run
+        ax.set_title(title)
+        ax.axis("off")
+        return
     pivot_data = dataset.pivot(
         index="Dataset", columns="Protocol", values="Average Serialization Time (s)"
     )
@@ -57,6 +54,10 @@ def plot_serialization_time(ax, dataset, title):
 
 # Plot deserialization time
 def plot_deserialization_time(ax, dataset, title):
+    if dataset.empty:  # e.g. no 256MB datasets in this run
+        ax.set_title(title)
+        ax.axis("off")
+        return
     pivot_data = dataset.pivot(
         index="Dataset", columns="Protocol", values="Average Deserialization Time (s)"
     )
@@ -69,25 +70,43 @@ def plot_deserialization_time(ax, dataset, title):
 
 
 # Create plots
-fig, axes = plt.subplots(3, 2, figsize=(15, 18))
-fig.suptitle("Serialization Benchmark Results", fontsize=16)
-
-display_system_info(axes[0, 0])
-plot_compression_ratio(axes[0, 1])
-plot_serialization_time(
-    axes[1, 0], small_datasets, "Serialization Time for Small Datasets"
-)
-plot_deserialization_time(
-    axes[1, 1], small_datasets, "Deserialization Time for Small Datasets"
-)
-plot_serialization_time(
-    axes[2, 0], large_datasets, "Serialization Time for Large Datasets (256MB)"
-)
-plot_deserialization_time(
-    axes[2, 1], large_datasets, "Deserialization Time for Large Datasets (256MB)"
-)
-
-# Save and show the results
-plt.tight_layout(rect=[0, 0, 1, 0.95])
-plt.savefig("serialization_visualization_split.png")
-plt.show()
+def create_figure(system_info, results):
+    results = pd.DataFrame(results)
+
+    # Separate datasets into two groups: large and small datasets
+    large_datasets = results[results["Dataset"].str.contains("256MB")]
+    small_datasets = results[~results["Dataset"].str.contains("256MB")]
+
+    fig, axes = plt.subplots(3, 2, figsize=(15, 18))
+    fig.suptitle("Serialization Benchmark Results", fontsize=16)
+
+    display_system_info(axes[0, 0], system_info)
+    plot_compression_ratio(axes[0, 1], results)
+    plot_serialization_time(
+        axes[1, 0], small_datasets, "Serialization Time for Small Datasets"
+    )
+    plot_deserialization_time(
+        axes[1, 1], small_datasets, "Deserialization Time for Small Datasets"
+    )
+    plot_serialization_time(
+        axes[2, 0], large_datasets, "Serialization Time for Large Datasets (256MB)"
+    )
+    plot_deserialization_time(
+        axes[2, 1], large_datasets, "Deserialization Time for Large Datasets (256MB)"
+    )
+
+    fig.tight_layout(rect=[0, 0, 1, 0.95])
+    return fig
+
+
+def main():
+    system_info, results = load_results(RESULTS_FILE)
+    fig = create_figure(system_info, results)
+
+    # Save and show the results
+    fig.savefig(f"{CHART_NAME}.png")
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,14 @@
-import json
 import pandas as pd
 import matplotlib.pyplot as plt
 
-# Load results
-with open("serialization_test_results/results.json", "r") as file:
-    data = json.load(file)
+from results_io import load_results
 
-results = pd.DataFrame(data["results"])
-system_info = data["system_info"]
-
-# Separate datasets into two groups: large and small datasets
-large_datasets = results[results["Dataset"].str.contains("256MB")]
-small_datasets = results[~results["Dataset"].str.contains("256MB")]
+RESULTS_FILE = "serialization_test_results/results.json"
+CHART_NAME = "serialization_visualization_logarithmic"
 
 
 # Plot system information
-def display_system_info(ax):
+def display_system_info(ax, system_info):
     sys_text = "\n".join([f"{key}: {value}" for key, value in system_info.items()])
     ax.text(
         0.1,
@@ -31,8 +24,12 @@ def display_system_info(ax):
 
 # Plot serialization time
 def plot_serialization_time(ax, dataset, title):
+    if dataset.empty:  # e.g. no 256MB datasets in this run
+        ax.set_title(title)
+        ax.axis("off")
+        return
     pivot_data = dataset.pivot(
-        index="Dataset", columns="Protocol", values="Serialization Time (s)"
+        index="Dataset", columns="Protocol", values="Average Serialization Time (s)"
     )
     pivot_data.plot(kind="bar", ax=ax, log=True)
     ax.set_title(title)
@@ -44,8 +41,12 @@ def plot_serialization_time(ax, dataset, title):
 
 # Plot deserialization time
 def plot_deserialization_time(ax, dataset, title):
+    if dataset.empty:  # e.g. no 256MB datasets in this run
+        ax.set_title(title)
+        ax.axis("off")
+        return
     pivot_data = dataset.pivot(
-        index="Dataset", columns="Protocol", values="Deserialization Time (s)"
+        index="Dataset", columns="Protocol", values="Average Deserialization Time (s)"
     )
     pivot_data.plot(kind="bar", ax=ax, log=True)
     ax.set_title(title)
@@ -56,24 +57,46 @@ def plot_deserialization_time(ax, dataset, title):
 
 
 # Create plots
-fig, axes = plt.subplots(3, 2, figsize=(15, 18))
-fig.suptitle("Serialization Benchmark Results (Logarithmic Scale)", fontsize=16)
-
-display_system_info(axes[0, 0])
-plot_serialization_time(
-    axes[1, 0], small_datasets, "Serialization Time for Small Datasets (Logarithmic)"
-)
-plot_deserialization_time(
-    axes[1, 1], small_datasets, "Deserialization Time for Small Datasets (Logarithmic)"
-)
-plot_serialization_time(
-    axes[2, 0], large_datasets, "Serialization Time for Large Datasets (Logarithmic)"
-)
-plot_deserialization_time(
-    axes[2, 1], large_datasets, "Deserialization Time for Large Datasets (Logarithmic)"
-)
-
-# Save and show the results
-plt.tight_layout(rect=[0, 0, 1, 0.95])
-plt.savefig("serialization_visualization_logarithmic.png")
-plt.show()
+def create_figure(system_info, results):
+    results = pd.DataFrame(results)
+
+    # Separate datasets into two groups: large and small datasets
+    large_datasets = results[results["Dataset"].str.contains("256MB")]
+    small_datasets = results[~results["Dataset"].str.contains("256MB")]
+
+    fig, axes = plt.subplots(3, 2, figsize=(15, 18))
+    fig.suptitle("Serialization Benchmark Results (Logarithmic Scale)", fontsize=16)
+
+    display_system_info(axes[0, 0], system_info)
+    plot_serialization_time(
+        axes[1, 0], small_datasets, "Serialization Time for Small Datasets (Logarithmic)"
+    )
+    plot_deserialization_time(
+        axes[1, 1],
+        small_datasets,
+        "Deserialization Time for Small Datasets (Logarithmic)",
+    )
+    plot_serialization_time(
+        axes[2, 0], large_datasets, "Serialization Time for Large Datasets (Logarithmic)"
+    )
+    plot_deserialization_time(
+        axes[2, 1],
+        large_datasets,
+        "Deserialization Time for Large Datasets (Logarithmic)",
+    )
+
+    fig.tight_layout(rect=[0, 0, 1, 0.95])
+    return fig
+
+
+def main():
+    system_info, results = load_results(RESULTS_FILE)
+    fig = create_figure(system_info, results)
+
+    # Save and show the results
+    fig.savefig(f"{CHART_NAME}.png")
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
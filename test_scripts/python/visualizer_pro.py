@@ -1,29 +1,34 @@
-import json
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Button
 import os
 
-# Load results
-with open("serialization_test_results/results.json", "r") as file:
-    data = json.load(file)
+from results_io import load_results
+
+RESULTS_FILE = "serialization_test_results/results.json"
 
 separate_mode = True  # Ändere hier zwischen True (getrennt) und False (kombiniert)
 labels_as_legend = False  # Nur relevant bei separate_mode=True. True = Labels als Legende, False = Labels unter dem Diagramm
 
-# Output-Verzeichnis erstellen
-if separate_mode:
-    output_dir = "exported_charts_separate"
-else:
-    output_dir = "exported_charts_combined"
-os.makedirs(output_dir, exist_ok=True)
+
+def get_output_dir(separate_mode):
+    if separate_mode:
+        return "exported_charts_separate"
+    return "exported_charts_combined"
+
 
 # Daten nach Dataset gruppieren
-datasets = {}
-for item in data[1:]:
-    dataset_name = item["Dataset"]
-    if dataset_name not in datasets:
-        datasets[dataset_name] = []
-    datasets[dataset_name].append(item)
+def group_by_dataset(results):
+    datasets = {}
+    for item in results:
+        dataset_name = item["Dataset"]
+        if dataset_name not in datasets:
+            datasets[dataset_name] = []
+        datasets[dataset_name].append(item)
+    return datasets
+
+
+def chart_filename(chart_name):
+    return f"{chart_name.replace('.', '_')}.png"
 
 # Farbschema für Protokolle
 protocol_colors = {
@@ -31,6 +36,12 @@ protocol_colors = {
     "XML": "orange",
     "MessagePack": "green",
     "ProtoBuf": "red",
+    "ProtoBuf (flat)": "salmon",
+    "MessagePack (stream)": "olive",
+    "MessagePack (stream, file)": "darkkhaki",
+    "Arrow IPC (stream)": "purple",
+    "Arrow IPC (file)": "brown",
+    "NumPy (.npy)": "gray",
 }
 
 
@@ -118,7 +129,12 @@ def create_combined_compression_chart(datasets):
     fig, ax = plt.subplots(figsize=(14, 8))
 
     dataset_names = list(datasets.keys())
-    protocols = list(protocol_colors.keys())
+    # Nur Protokolle, die in den Ergebnissen vorkommen
+    protocols = [
+        protocol
+        for protocol in protocol_colors
+        if any(p["Protocol"] == protocol for items in datasets.values() for p in items)
+    ]
 
     # Anzahl der Protokolle und Datensets
     protocol_count = len(protocols)
@@ -171,30 +187,39 @@ def create_combined_compression_chart(datasets):
     return fig
 
 
-# Alle Diagramme erstellen und speichern
-all_figures = []
+def main():
+    _, results = load_results(RESULTS_FILE)
+
+    output_dir = get_output_dir(separate_mode)
+    os.makedirs(output_dir, exist_ok=True)
+    datasets = group_by_dataset(results)
+
+    # Alle Diagramme erstellen und speichern
+    all_figures = []
 
-for dataset_name, protocols in datasets.items():
-    figures = create_chart(dataset_name, protocols, separate_mode)
-    all_figures.extend(figures)
+    for dataset_name, protocols in datasets.items():
+        figures = create_chart(dataset_name, protocols, separate_mode)
+        all_figures.extend(figures)
 
-if not separate_mode:
-    compression_chart = create_combined_compression_chart(datasets)
-    all_figures.append(("combined_compression_ratios", compression_chart))
+    if not separate_mode:
+        compression_chart = create_combined_compression_chart(datasets)
+        all_figures.append(("combined_compression_ratios", compression_chart))
 
+    # Export-All-Funktion
+    def export_all():
+        for dataset_name, fig in all_figures:
+            export_path = os.path.join(output_dir, chart_filename(dataset_name))
+            fig.savefig(export_path)
+            print(f"Diagramm für {dataset_name} gespeichert unter: {export_path}")
+        print("Alle Diagramme erfolgreich exportiert.")
 
-# Export-All-Funktion
-def export_all():
-    for dataset_name, fig in all_figures:
-        export_path = os.path.join(output_dir, f"{dataset_name.replace('.', '_')}.png")
-        fig.savefig(export_path)
-        print(f"Diagramm für {dataset_name} gespeichert unter: {export_path}")
-    print("Alle Diagramme erfolgreich exportiert.")
+    # "Export All"-Button anzeigen
+    export_all_button = plt.figure(figsize=(4, 1))
+    ax_button = export_all_button.add_axes([0.3, 0.4, 0.4, 0.3])
+    button = plt.Button(ax_button, "Export All")
+    button.on_clicked(lambda _: export_all())
+    plt.show()
 
 
-# "Export All"-Button anzeigen
-export_all_button = plt.figure(figsize=(4, 1))
-ax_button = export_all_button.add_axes([0.3, 0.4, 0.4, 0.3])
-button = plt.Button(ax_button, "Export All")
-button.on_clicked(lambda _: export_all())
-plt.show()
+if __name__ == "__main__":
+    main()